@@ -1,54 +1,29 @@
-from datetime import datetime
-
-from src.config.logger import get_logger
-from src.llms.llm import get_llm_by_type
-from src.prompts.template import get_prompt_template
-from src.agent.agent import create_deepagent
-from src.tools import (
-    crawl_tool,
-    get_web_search_tool,
-    think_tool,
+from src.agent.factory import (
+    build_agent,
+    get_instructions,
+    planer_sub_agent as _planer_sub_agent,
+    research_sub_agent as _research_sub_agent,
 )
-logger = get_logger(__name__)
-# Limits
-max_concurrent_research_units = 3
-max_researcher_iterations = 3
-
-
-# Combine orchestrator instructions (RESEARCHER_INSTRUCTIONS only for sub-agents)
-INSTRUCTIONS = get_prompt_template("coordinator").format(
-        CURRENT_TIME = datetime.now().strftime("%Y-%m-%d"),
-        max_concurrent_research_units=max_concurrent_research_units,
-        max_researcher_iterations=max_researcher_iterations,
-    )
+from src.config.logger import get_logger
 
-planer_sub_agent = {
-    "name": "planer-agent",
-    "description": "根据用户需求，规划研究计划。",
-    "system_prompt": get_prompt_template("planner"),
-    "tools": [get_web_search_tool()],
-    "model": get_llm_by_type("reasoning"),
-    #"middleware": [LoggingMiddleware()],
-    "debug": True,
-}
+logger = get_logger(__name__)
 
-research_sub_agent = {
-    "name": "research-agent",
-    "description": "将研究工作委托给子代理研究员。每次只给这个研究者一个课题。",
-    "system_prompt": get_prompt_template("researcher"),
-    "tools": [get_web_search_tool(),think_tool, crawl_tool],
-    "model": get_llm_by_type("reasoning"),
-    #"middleware": [LoggingMiddleware()],
-    "debug": True,
+# The LLM clients, tools and agent graph are only built when first accessed
+# (PEP 562), so importing this module for INSTRUCTIONS stays cheap.
+_LAZY_ATTRS = {
+    "planer_sub_agent": _planer_sub_agent,
+    "research_sub_agent": _research_sub_agent,
+    "agent": lambda: build_agent("coordinator"),
 }
 
 
-
-agent = create_deepagent(
-    model=get_llm_by_type("basic"),
-    tools=[],
-    system_prompt=INSTRUCTIONS,
-    subagents=[research_sub_agent],
-    debug=True,
-)
-
+def __getattr__(name: str):
+    # Orchestrator instructions (RESEARCHER_INSTRUCTIONS only for sub-agents),
+    # formatted on every access so the date is always today's
+    if name == "INSTRUCTIONS":
+        return get_instructions()
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name not in globals():
+        globals()[name] = _LAZY_ATTRS[name]()
+    return globals()[name]
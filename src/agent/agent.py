@@ -1,5 +1,6 @@
 """Deepagents come with planning, filesystem, and subagents."""
 
+from collections import OrderedDict
 from collections.abc import Callable, Sequence
 from typing import Any
 from pathlib import Path
@@ -8,7 +9,6 @@ from datetime import datetime
 
 from langchain.agents import create_agent
 from langchain.agents.middleware import HumanInTheLoopMiddleware, InterruptOnConfig, TodoListMiddleware
-from langchain.agents.middleware.summarization import SummarizationMiddleware
 from langchain.agents.middleware.types import AgentMiddleware
 from langchain.agents.structured_output import ResponseFormat
 from langchain_anthropic.middleware import AnthropicPromptCachingMiddleware
@@ -29,9 +29,153 @@ from deepagents.middleware.subagents import CompiledSubAgent, SubAgent, SubAgent
 
 
 from src.llms.llm import get_llm_by_type
+from src.config.loader import get_bool_env
 from src.config.logger import get_logger
+from src.middleware.current_time_middleware import CurrentTimePromptMiddleware
+from src.middleware.prompt_cache_middleware import (
+    AnthropicCacheBreakpointMiddleware,
+    is_anthropic_model,
+)
+from src.middleware.summarization_middleware import CachedSummarizationMiddleware
+from src.middleware.tool_concurrency_middleware import ConcurrentToolExecutorMiddleware
 logger = get_logger(__name__)
 
+# Middleware stacks keyed by the identity of their inputs. The inputs are
+# kept in the value so their ids cannot be reused while the entry exists.
+# Bounded LRU: callers that build agents from fresh tool lists would
+# otherwise pin every compiled subagent graph for the life of the process.
+MIDDLEWARE_CACHE_SIZE = 32
+_middleware_cache: OrderedDict[tuple, tuple[Any, list[AgentMiddleware]]] = OrderedDict()
+
+
+def _middleware_cache_key(
+    model: str | BaseChatModel,
+    tools: Sequence[BaseTool | Callable | dict[str, Any]] | None,
+    subagents: list[SubAgent | CompiledSubAgent] | None,
+    interrupt_on: dict[str, bool | InterruptOnConfig] | None,
+    max_concurrent_subagents: int | None,
+) -> tuple:
+    return (
+        model if isinstance(model, str) else id(model),
+        tuple(id(tool) for tool in tools or ()),
+        tuple(id(subagent) for subagent in subagents or ()),
+        repr(sorted(interrupt_on.items())) if interrupt_on else None,
+        max_concurrent_subagents,
+    )
+
+
+def _prompt_caching_middleware(enabled: bool) -> list[AgentMiddleware]:
+    """Anthropic prompt caching middleware, or nothing for other providers."""
+    if not enabled:
+        return []
+    return [
+        AnthropicPromptCachingMiddleware(unsupported_model_behavior="ignore"),
+        AnthropicCacheBreakpointMiddleware(),
+    ]
+
+
+def _with_prompt_caching(
+    subagent: SubAgent | CompiledSubAgent, default_is_anthropic: bool
+) -> SubAgent | CompiledSubAgent:
+    """Decide prompt caching for one subagent spec.
+
+    The shared subagent stack only carries the caching middleware when the
+    default (main) model is Anthropic, which covers the general-purpose
+    agent and specs without their own model. A spec that brings its own
+    Anthropic model gets the middleware appended to its own list instead.
+    """
+    subagent_model = subagent.get("model")
+    if (
+        default_is_anthropic
+        or "runnable" in subagent
+        or subagent_model is None
+        or not is_anthropic_model(subagent_model)
+    ):
+        return subagent
+    return {
+        **subagent,
+        "middleware": [*subagent.get("middleware", []), *_prompt_caching_middleware(True)],
+    }
+
+
+def _build_deepagent_middleware(
+    model: str | BaseChatModel,
+    tools: Sequence[BaseTool | Callable | dict[str, Any]] | None,
+    subagents: list[SubAgent | CompiledSubAgent] | None,
+    interrupt_on: dict[str, bool | InterruptOnConfig] | None,
+    max_concurrent_subagents: int | None,
+) -> list[AgentMiddleware]:
+    """Build the standard deep agent middleware stack, reusing a cached one.
+
+    SubAgentMiddleware compiles every subagent graph on construction, so
+    agents created repeatedly with the same model, tools and subagents share
+    one stack. A fresh list is returned so callers can append to it.
+    """
+    key = _middleware_cache_key(
+        model, tools, subagents, interrupt_on, max_concurrent_subagents
+    )
+    cached = _middleware_cache.get(key)
+    if cached is not None:
+        _middleware_cache.move_to_end(key)
+        return list(cached[1])
+
+    main_is_anthropic = is_anthropic_model(model)
+
+    middleware = [
+        CurrentTimePromptMiddleware(),
+        TodoListMiddleware(),
+        FilesystemMiddleware(),
+        SubAgentMiddleware(
+            default_model=model,
+            default_tools=tools,
+            subagents=[
+                _with_prompt_caching(subagent, main_is_anthropic) for subagent in subagents or ()
+            ],
+            default_middleware=[
+                CurrentTimePromptMiddleware(),
+                TodoListMiddleware(),
+                FilesystemMiddleware(),
+                CachedSummarizationMiddleware(
+                    model=model,
+                    max_tokens_before_summary=256000,
+                    messages_to_keep=20,
+                ),
+                *_prompt_caching_middleware(main_is_anthropic),
+                ConcurrentToolExecutorMiddleware(),
+                PatchToolCallsMiddleware(),
+            ],
+            default_interrupt_on=interrupt_on,
+            general_purpose_agent=True,
+        ),
+        CachedSummarizationMiddleware(
+            model=model,
+            max_tokens_before_summary=256000,
+            messages_to_keep=20,
+        ),
+        *_prompt_caching_middleware(main_is_anthropic),
+        ConcurrentToolExecutorMiddleware(max_concurrent_subagents=max_concurrent_subagents),
+        PatchToolCallsMiddleware(),
+    ]
+
+    _middleware_cache[key] = ((model, tools, subagents, interrupt_on), middleware)
+    while len(_middleware_cache) > MIDDLEWARE_CACHE_SIZE:
+        _middleware_cache.popitem(last=False)
+    return list(middleware)
+
+
+def _get_default_checkpointer() -> Checkpointer | None:
+    """Return a fresh in-memory checkpointer when LANGGRAPH_IN_MEMORY_CHECKPOINT is enabled.
+
+    Each agent gets its own InMemorySaver, so agents never read each other's
+    threads. Durable savers (the LANGGRAPH_CHECKPOINT_SAVER / _DB_URL
+    settings) must be opened inside the caller's event loop and are passed
+    in explicitly through ``checkpointer``.
+    """
+    if not get_bool_env("LANGGRAPH_IN_MEMORY_CHECKPOINT"):
+        return None
+    return InMemorySaver()
+
+
 def create_deepagent(
     model: str | BaseChatModel | None = None,
     tools: Sequence[BaseTool | Callable | dict[str, Any]] | None = None,
@@ -46,6 +190,8 @@ def create_deepagent(
     debug: bool = False,
     name: str | None = None,
     cache: BaseCache | None = None,
+    max_concurrent_subagents: int | None = 3,
+    recursion_limit: int = 100,
 ) -> CompiledStateGraph:
     """Create a deep agent.
 
@@ -75,6 +221,9 @@ def create_deepagent(
         response_format: A structured output response format to use for the agent.
         context_schema: The schema of the deep agent.
         checkpointer: Optional checkpointer for persisting agent state between runs.
+            Defaults to a per-agent in-memory saver when LANGGRAPH_IN_MEMORY_CHECKPOINT
+            is set. With a checkpointer, every run must pass its own
+            `{"configurable": {"thread_id": ...}}`.
         store: Optional store for persistent storage (required if backend uses StoreBackend).
         backend: Optional backend for file storage and execution. Pass either a Backend instance
             or a callable factory like `lambda rt: StateBackend(rt)`. For execution support,
@@ -84,42 +233,23 @@ def create_deepagent(
         debug: Whether to enable debug mode. Passed through to create_agent.
         name: The name of the agent. Passed through to create_agent.
         cache: The cache to use for the agent. Passed through to create_agent.
+        max_concurrent_subagents: Upper bound on subagents running at once when
+            the model dispatches several `task` calls in one turn. None disables it.
+        recursion_limit: Maximum number of graph steps per run. Long jobs should
+            resume from the checkpointer on the same thread rather than raise
+            this; a single run can still override it through its own config.
 
     Returns:
         A configured deep agent.
     """
     if model is None:
         model = get_llm_by_type("basic")
+    if checkpointer is None:
+        checkpointer = _get_default_checkpointer()
 
-    deepagent_middleware = [
-        TodoListMiddleware(),
-        FilesystemMiddleware(),
-        SubAgentMiddleware(
-            default_model=model,
-            default_tools=tools,
-            subagents=subagents if subagents is not None else [],
-            default_middleware=[
-                TodoListMiddleware(),
-                FilesystemMiddleware(),
-                SummarizationMiddleware(
-                    model=model,
-                    max_tokens_before_summary=256000,
-                    messages_to_keep=20,
-                ),
-                AnthropicPromptCachingMiddleware(unsupported_model_behavior="ignore"),
-                PatchToolCallsMiddleware(),
-            ],
-            default_interrupt_on=interrupt_on,
-            general_purpose_agent=True,
-        ),
-        SummarizationMiddleware(
-            model=model,
-            max_tokens_before_summary=256000,
-            messages_to_keep=20,
-        ),
-        AnthropicPromptCachingMiddleware(unsupported_model_behavior="ignore"),
-        PatchToolCallsMiddleware(),
-    ]
+    deepagent_middleware = _build_deepagent_middleware(
+        model, tools, subagents, interrupt_on, max_concurrent_subagents
+    )
 
     if interrupt_on is not None:
         deepagent_middleware.append(HumanInTheLoopMiddleware(interrupt_on=interrupt_on))
@@ -136,4 +266,4 @@ def create_deepagent(
         debug=debug,
         name=name,
         cache=cache,
-    ).with_config({"recursion_limit": 1000})
+    ).with_config({"recursion_limit": recursion_limit})
@@ -0,0 +1,101 @@
+"""Build the agent graphs and subagent specs from named profiles."""
+
+import functools
+from typing import Literal, get_args
+
+from src.prompts.template import get_prompt_template
+from src.utils.time_utils import CURRENT_TIME_PLACEHOLDER, fill_current_time
+
+# Limits
+max_concurrent_research_units = 3
+max_researcher_iterations = 3
+
+AgentProfile = Literal["coordinator"]
+
+
+@functools.lru_cache(maxsize=8)
+def _instructions(max_concurrent_research_units: int, max_researcher_iterations: int) -> str:
+    # The date stays a placeholder; CurrentTimePromptMiddleware fills it in
+    # on every model call so long-lived graphs roll over at midnight.
+    return get_prompt_template("coordinator").format(
+        CURRENT_TIME=CURRENT_TIME_PLACEHOLDER,
+        max_concurrent_research_units=max_concurrent_research_units,
+        max_researcher_iterations=max_researcher_iterations,
+    )
+
+
+def get_instructions_template() -> str:
+    """Return the orchestrator instructions with the date left as a placeholder."""
+    return _instructions(max_concurrent_research_units, max_researcher_iterations)
+
+
+def get_instructions() -> str:
+    """Format the orchestrator instructions with today's date."""
+    return fill_current_time(get_instructions_template())
+
+
+# The LLM clients and tools are imported inside the builders so importing
+# this module for the instructions stays cheap. Specs are memoized so every
+# profile shares the same subagent objects (and their middleware stack).
+@functools.lru_cache(maxsize=None)
+def planer_sub_agent() -> dict:
+    from src.llms.llm import get_llm_by_type
+    from src.tools import get_web_search_tool
+
+    return {
+        "name": "planer-agent",
+        "description": "根据用户需求，规划研究计划。",
+        "system_prompt": get_prompt_template("planner"),
+        "tools": [get_web_search_tool()],
+        "model": get_llm_by_type("reasoning"),
+        #"middleware": [LoggingMiddleware()],
+        "debug": True,
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def research_sub_agent() -> dict:
+    from src.llms.llm import get_llm_by_type
+    from src.tools import crawl_tool, get_web_search_tool, think_tool
+
+    return {
+        "name": "research-agent",
+        "description": "将研究工作委托给子代理研究员。每次只给这个研究者一个课题。",
+        "system_prompt": get_prompt_template("researcher"),
+        "tools": [get_web_search_tool(),think_tool, crawl_tool],
+        "model": get_llm_by_type("reasoning"),
+        #"middleware": [LoggingMiddleware()],
+        "debug": True,
+    }
+
+
+def build_agent(profile: AgentProfile = "coordinator"):
+    """Build (once) the deep agent for a profile.
+
+    Args:
+        profile: "coordinator" delegates research topics to the research
+            subagent.
+
+    Returns:
+        The compiled agent graph.
+    """
+    if profile not in get_args(AgentProfile):
+        raise ValueError(f"Unknown agent profile: {profile}")
+    # Always call the cached builder positionally: lru_cache keys
+    # build_agent(), build_agent("x") and build_agent(profile="x") apart.
+    return _build_agent(profile)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_agent(profile: AgentProfile):
+    from src.agent.agent import create_deepagent
+    from src.llms.llm import get_llm_by_type
+
+    return create_deepagent(
+        model=get_llm_by_type("basic"),
+        tools=[],
+        system_prompt=get_instructions_template(),
+        subagents=[research_sub_agent()],
+        debug=True,
+        max_concurrent_subagents=max_concurrent_research_units,
+    )
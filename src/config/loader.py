@@ -3,6 +3,16 @@ from typing import Any, Dict
 
 import yaml
 
+from src.config.logger import get_logger
+
+try:
+    # libyaml 的 C 实现，解析速度比纯 Python 版本快数倍
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+logger = get_logger(__name__)
+
 
 def get_bool_env(name: str, default: bool = False) -> bool:
     val = os.getenv(name)
@@ -23,7 +33,7 @@ def get_int_env(name: str, default: int = 0) -> int:
     try:
         return int(val.strip())
     except ValueError:
-        print(f"Invalid integer value for {name}: {val}. Using default {default}.")
+        logger.warning(f"Invalid integer value for {name}: {val}. Using default {default}.")
         return default
 
 
@@ -67,9 +77,17 @@ def load_yaml_config(file_path: str) -> Dict[str, Any]:
 
     # 如果缓存中不存在，则加载并处理配置
     with open(file_path, "r") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=SafeLoader)
     processed_config = process_dict(config)
 
     # 将处理后的配置存入缓存
     _config_cache[file_path] = processed_config
     return processed_config
+
+
+def clear_yaml_config_cache(file_path: str | None = None) -> None:
+    """Drop cached YAML configuration for one file, or for all files."""
+    if file_path is None:
+        _config_cache.clear()
+    else:
+        _config_cache.pop(file_path, None)
@@ -1,7 +1,7 @@
 from loguru import logger
 import sys
 from pathlib import Path
-import json
+import orjson
 from datetime import datetime
 
 # 创建基础日志目录
@@ -13,28 +13,26 @@ current_date = datetime.now().strftime('%Y-%m-%d')
 log_dir = base_log_dir / current_date
 log_dir.mkdir(exist_ok=True)
 
+# 所有输出共用同一格式，非终端输出时 loguru 会自动去掉颜色标签
+LOG_FORMAT = "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> | <cyan>{file}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
+
+# enqueue=True 让写入在后台线程完成，不阻塞调用方；关闭 backtrace/diagnose 避免昂贵的变量回溯
+SINK_OPTIONS = {"format": LOG_FORMAT, "enqueue": True, "backtrace": False, "diagnose": False}
+
 # 移除默认的控制台输出
 logger.remove()
 
 # 添加控制台输出
-logger.add(
-    sys.stdout,
-    format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level: <8}</level> |<cyan>{file}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-    level="INFO"
-)
+logger.add(sys.stdout, level="INFO", **SINK_OPTIONS)
 
 # 添加文件输出 - 直接使用固定路径（兼容旧版本loguru）
-logger.add(
-    str(log_dir / f"app_{current_date}.log"),
-    format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {file}:{function}:{line} - {message}",
-    level="INFO"
-)
+logger.add(str(log_dir / f"app_{current_date}.log"), level="INFO", **SINK_OPTIONS)
 
 # 错误日志单独存储
 logger.add(
     str(log_dir / f"error_{current_date}.log"),
-    format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {file}:{function}:{line} - {message}",
-    level="ERROR"
+    filter=lambda record: record["level"].no >= 40,
+    **SINK_OPTIONS,
 )
 
 def get_logger(service: str):
@@ -43,4 +41,4 @@ def get_logger(service: str):
 
 def log_structured(event_type: str, data: dict):
     """结构化日志记录"""
-    logger.info({"event_type": event_type, "data": data}) 
\ No newline at end of file
+    logger.info(orjson.dumps({"event_type": event_type, "data": data}, default=str).decode()) 
\ No newline at end of file
@@ -1,6 +1,8 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import asyncio
+
 from src.config.logger import get_logger
 
 from .article import Article
@@ -28,13 +30,27 @@ class Crawler:
         except Exception as e:
             logger.error(f"Failed to fetch URL {url} from Jina: {repr(e)}")
             raise
-        
+
+        return self._extract(url, html)
+
+    async def acrawl(self, url: str) -> Article:
+        try:
+            jina_client = JinaClient()
+            html = await jina_client.acrawl(url, return_format="html")
+        except Exception as e:
+            logger.error(f"Failed to fetch URL {url} from Jina: {repr(e)}")
+            raise
+
+        # Readability extraction is CPU bound, keep it off the event loop
+        return await asyncio.to_thread(self._extract, url, html)
+
+    def _extract(self, url: str, html: str) -> Article:
         try:
             extractor = ReadabilityExtractor()
             article = extractor.extract_article(html)
         except Exception as e:
             logger.error(f"Failed to extract article from {url}: {repr(e)}")
             raise
-        
+
         article.url = url
         return article
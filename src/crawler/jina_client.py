@@ -2,15 +2,47 @@
 # SPDX-License-Identifier: MIT
 
 from src.config.logger import get_logger
+import asyncio
 import os
+import threading
+import weakref
 
-import requests
+import httpx
+import orjson
 
 logger = get_logger(__name__)
 
+JINA_READER_URL = "https://r.jina.ai/"
+
+# Shared clients so crawls reuse pooled keep-alive HTTP/2 connections
+# instead of paying a TLS handshake per URL. An AsyncClient's pool is bound
+# to the event loop it first ran on, so async clients are kept per loop.
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+
+
+def _get_client() -> httpx.Client:
+    global _client
+    with _client_lock:
+        if _client is None or _client.is_closed:
+            _client = httpx.Client(http2=True, timeout=30)
+        return _client
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(http2=True, timeout=30)
+        _async_clients[loop] = client
+    return client
+
 
 class JinaClient:
-    def crawl(self, url: str, return_format: str = "html") -> str:
+    def _build_headers(self, return_format: str) -> dict:
         headers = {
             "Content-Type": "application/json",
             "X-Return-Format": return_format,
@@ -21,13 +53,27 @@ class JinaClient:
             logger.warning(
                 "Jina API key is not set. Provide your own key to access a higher rate limit. See https://jina.ai/reader for more information."
             )
-        data = {"url": url}
-        response = requests.post("https://r.jina.ai/", headers=headers, json=data)
-        
-        if response.status_code != 200:
-            raise ValueError(f"Jina API returned status {response.status_code}: {response.text}")
-        
-        if not response.text or not response.text.strip():
+        return headers
+
+    def _check_response(self, status_code: int, text: str) -> str:
+        if status_code != 200:
+            raise ValueError(f"Jina API returned status {status_code}: {text}")
+
+        if not text or not text.strip():
             raise ValueError("Jina API returned empty response")
-        
-        return response.text
+
+        return text
+
+    def crawl(self, url: str, return_format: str = "html") -> str:
+        headers = self._build_headers(return_format)
+        data = orjson.dumps({"url": url})
+        response = _get_client().post(JINA_READER_URL, headers=headers, content=data)
+        return self._check_response(response.status_code, response.text)
+
+    async def acrawl(self, url: str, return_format: str = "html") -> str:
+        headers = self._build_headers(return_format)
+        data = orjson.dumps({"url": url})
+        response = await _get_async_client().post(
+            JINA_READER_URL, headers=headers, content=data
+        )
+        return self._check_response(response.status_code, response.text)
@@ -1,34 +1,126 @@
+import copy
+import functools
 import os
+import re
+import threading
+from collections import ChainMap
 from pathlib import Path
-from typing import Any, Dict, get_args
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, get_args
 
 import httpx
 from langchain.chat_models import init_chat_model
 from langchain_core.language_models import BaseChatModel
 
 from src.config import load_yaml_config
+from src.config.loader import clear_yaml_config_cache
+from src.config.logger import get_logger
 
 from typing import Literal
+
+logger = get_logger(__name__)
+
 # Define available LLM types
 LLMType = Literal["basic", "reasoning", "vision", "code"]
+_LLM_TYPES = get_args(LLMType)
 
-# Cache for LLM instances
-_llm_cache: dict[LLMType, BaseChatModel] = {}
+# Mapping of LLM types to their configuration keys
+_LLM_TYPE_CONFIG_KEYS = MappingProxyType({
+    "reasoning": "REASONING_MODEL",
+    "basic": "BASIC_MODEL",
+    "vision": "VISION_MODEL",
+    "code": "CODE_MODEL",
+})
 
 
+@functools.lru_cache(maxsize=None)
 def _get_config_file_path() -> str:
     """Get the path to the configuration file."""
     return str((Path(__file__).parent.parent.parent / "conf.yaml").resolve())
 
 
-def _get_llm_type_config_keys() -> dict[str, str]:
-    """Get mapping of LLM types to their configuration keys."""
-    return {
-        "reasoning": "REASONING_MODEL",
-        "basic": "BASIC_MODEL",
-        "vision": "VISION_MODEL",
-        "code": "CODE_MODEL",
-    }
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
+
+def _validate_conf(conf: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Check the LLM sections of the config once, when the snapshot is built,
+    so readers can treat every present section as a mapping. A malformed
+    section is logged and dropped; only that LLM type is then unconfigured.
+    """
+    for llm_type, config_key in _LLM_TYPE_CONFIG_KEYS.items():
+        llm_conf = conf.get(config_key)
+        if llm_conf is not None and not isinstance(llm_conf, dict):
+            logger.warning(f"Ignoring invalid LLM configuration for {llm_type}: {llm_conf}")
+            del conf[config_key]
+    return conf
+
+
+@functools.lru_cache(maxsize=1)
+def _load_conf() -> Mapping[str, Any]:
+    """Load conf.yaml once per process as a read-only snapshot."""
+    # load_yaml_config hands out its cached dict; copy it so nothing can
+    # change the snapshot underneath
+    conf = copy.deepcopy(load_yaml_config(_get_config_file_path()))
+    return MappingProxyType(_validate_conf(conf))
+
+
+def reload_conf() -> None:
+    """
+    Drop the conf.yaml snapshot and the LLMs built from it, so the next read
+    parses the file again and new clients pick up the changes.
+    """
+    clear_yaml_config_cache(_get_config_file_path())
+    _load_conf.cache_clear()
+    get_llm_token_limit_by_type.cache_clear()
+    with _llm_lock:
+        _get_llm_by_type.cache_clear()
+
+
+# Providers whose chat models take http_client / http_async_client
+_HTTPX_CLIENT_PROVIDERS = frozenset({"openai", "azure_openai", "deepseek"})
+
+
+@functools.lru_cache(maxsize=2)
+def _get_http_clients(verify_ssl: bool) -> tuple[httpx.Client, httpx.AsyncClient]:
+    """
+    Get the pooled keep-alive HTTP clients shared by every LLM of this
+    process, one pair per SSL verification setting.
+    """
+    limits = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    timeout = httpx.Timeout(120.0, connect=10.0)
+    return (
+        httpx.Client(limits=limits, timeout=timeout, http2=True, verify=verify_ssl),
+        httpx.AsyncClient(limits=limits, timeout=timeout, http2=True, verify=verify_ssl),
+    )
+
+
+def _get_model_provider(conf: Dict[str, Any]) -> str | None:
+    """Get the provider from model_provider or a "provider:model" name."""
+    if conf.get("model_provider"):
+        return conf["model_provider"]
+    model = str(conf.get("model", ""))
+    return model.split(":", 1)[0] if ":" in model else None
+
+
+# Matches {LLM_TYPE}_MODEL__{KEY}, e.g. BASIC_MODEL__api_key
+_ENV_LLM_CONF_PATTERN = re.compile(
+    rf"^({'|'.join(t.upper() for t in _LLM_TYPES)})_MODEL__(.+)$"
+)
+
+
+def _get_env_llm_confs() -> Dict[str, Dict[str, Any]]:
+    """
+    Get LLM configuration for every type from environment variables in a
+    single pass over os.environ, bucketed by LLM type.
+    """
+    confs: Dict[str, Dict[str, Any]] = {}
+    for key, value in os.environ.items():
+        match = _ENV_LLM_CONF_PATTERN.match(key)
+        if match:
+            llm_type, conf_key = match.groups()
+            confs.setdefault(llm_type.lower(), {})[conf_key.lower()] = value
+    return confs
 
 
 def _get_env_llm_conf(llm_type: str) -> Dict[str, Any]:
@@ -37,32 +129,24 @@ def _get_env_llm_conf(llm_type: str) -> Dict[str, Any]:
     Environment variables should follow the format: {LLM_TYPE}__{KEY}
     e.g., BASIC_MODEL__api_key, BASIC_MODEL__base_url
     """
-    prefix = f"{llm_type.upper()}_MODEL__"
-    conf = {}
-    for key, value in os.environ.items():
-        if key.startswith(prefix):
-            conf_key = key[len(prefix) :].lower()
-            conf[conf_key] = value
-    return conf
+    return _get_env_llm_confs().get(llm_type, {})
 
 
-def _create_llm_use_conf(llm_type: LLMType, conf: Dict[str, Any]) -> BaseChatModel:
+def _create_llm_use_conf(llm_type: LLMType, conf: Mapping[str, Any]) -> BaseChatModel:
     """Create LLM instance using configuration."""
-    llm_type_config_keys = _get_llm_type_config_keys()
-    config_key = llm_type_config_keys.get(llm_type)
+    config_key = _LLM_TYPE_CONFIG_KEYS.get(llm_type)
 
     if not config_key:
         raise ValueError(f"Unknown LLM type: {llm_type}")
 
-    llm_conf = conf.get(config_key, {})
-    if not isinstance(llm_conf, dict):
-        raise ValueError(f"Invalid LLM configuration for {llm_type}: {llm_conf}")
+    # Sections were validated when the snapshot was built
+    llm_conf = conf.get(config_key) or _EMPTY_MAPPING
 
     # Get configuration from environment variables
     env_conf = _get_env_llm_conf(llm_type)
 
     # Merge configurations, with environment variables taking precedence
-    merged_conf = {**llm_conf, **env_conf}
+    merged_conf = dict(ChainMap(env_conf, llm_conf))
 
     # Remove unnecessary parameters when initializing the client
     if "token_limit" in merged_conf:
@@ -75,22 +159,40 @@ def _create_llm_use_conf(llm_type: LLMType, conf: Dict[str, Any]) -> BaseChatMod
     if "max_retries" not in merged_conf:
         merged_conf["max_retries"] = 3
 
+    # Share pooled HTTP clients so calls reuse connections instead of
+    # handshaking per client
+    verify_ssl = merged_conf.pop("verify_ssl", True)
+    if isinstance(verify_ssl, str):
+        verify_ssl = verify_ssl.strip().lower() not in {"0", "false", "no", "n", "off"}
+    if _get_model_provider(merged_conf) in _HTTPX_CLIENT_PROVIDERS:
+        http_client, http_async_client = _get_http_clients(bool(verify_ssl))
+        merged_conf.setdefault("http_client", http_client)
+        merged_conf.setdefault("http_async_client", http_async_client)
+
     model = init_chat_model(**merged_conf)
     return model
 
 
 
+# lru_cache alone lets two threads that miss at the same time both build a
+# client; the lock makes the first construction per type the only one.
+_llm_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_llm_by_type(llm_type: LLMType) -> BaseChatModel:
+    conf = _load_conf()
+    return _create_llm_use_conf(llm_type, conf)
+
+
 def get_llm_by_type(llm_type: LLMType) -> BaseChatModel:
     """
-    Get LLM instance by type. Returns cached instance if available.
+    Get LLM instance by type. Instances are cached per type, so every agent
+    and subagent asking for the same type shares one client and its
+    connection pool.
     """
-    if llm_type in _llm_cache:
-        return _llm_cache[llm_type]
-
-    conf = load_yaml_config(_get_config_file_path())
-    llm = _create_llm_use_conf(llm_type, conf)
-    _llm_cache[llm_type] = llm
-    return llm
+    with _llm_lock:
+        return _get_llm_by_type(llm_type)
 
 
 def get_configured_llm_models() -> dict[str, list[str]]:
@@ -101,24 +203,21 @@ def get_configured_llm_models() -> dict[str, list[str]]:
         Dictionary mapping LLM type to list of configured model names.
     """
     try:
-        conf = load_yaml_config(_get_config_file_path())
-        llm_type_config_keys = _get_llm_type_config_keys()
+        conf = _load_conf()
 
+        env_confs = _get_env_llm_confs()
         configured_models: dict[str, list[str]] = {}
 
-        for llm_type in get_args(LLMType):
+        for llm_type in _LLM_TYPES:
             # Get configuration from YAML file
-            config_key = llm_type_config_keys.get(llm_type, "")
-            yaml_conf = conf.get(config_key, {}) if config_key else {}
+            config_key = _LLM_TYPE_CONFIG_KEYS.get(llm_type, "")
+            yaml_conf = conf.get(config_key) or _EMPTY_MAPPING
 
             # Get configuration from environment variables
-            env_conf = _get_env_llm_conf(llm_type)
-
-            # Merge configurations, with environment variables taking precedence
-            merged_conf = {**yaml_conf, **env_conf}
+            env_conf = env_confs.get(llm_type, _EMPTY_MAPPING)
 
-            # Check if model is configured
-            model_name = merged_conf.get("model")
+            # Check if model is configured, with environment variables taking precedence
+            model_name = env_conf["model"] if "model" in env_conf else yaml_conf.get("model")
             if model_name:
                 configured_models.setdefault(llm_type, []).append(model_name)
 
@@ -126,10 +225,11 @@ def get_configured_llm_models() -> dict[str, list[str]]:
 
     except Exception as e:
         # Log error and return empty dict to avoid breaking the application
-        print(f"Warning: Failed to load LLM configuration: {e}")
+        logger.warning(f"Failed to load LLM configuration: {e}")
         return {}
 
 
+@functools.lru_cache(maxsize=8)
 def get_llm_token_limit_by_type(llm_type: str) -> int:
     """
     Get the maximum token limit for a given LLM type.
@@ -141,11 +241,11 @@ def get_llm_token_limit_by_type(llm_type: str) -> int:
         int: The maximum token limit for the specified LLM type.
     """
 
-    llm_type_config_keys = _get_llm_type_config_keys()
-    config_key = llm_type_config_keys.get(llm_type)
+    config_key = _LLM_TYPE_CONFIG_KEYS.get(llm_type)
 
-    conf = load_yaml_config(_get_config_file_path())
-    llm_max_token = conf.get(config_key, {}).get("token_limit")
+    # Cached per type: the config snapshot only changes through reload_conf()
+    conf = _load_conf()
+    llm_max_token = (conf.get(config_key) or _EMPTY_MAPPING).get("token_limit")
     return llm_max_token
 
 
@@ -1,28 +1,40 @@
 """
 中间件模块
 包含 LLM 调用追踪、工具调用追踪和 UI 事件注入
-"""
 
+子模块在首次访问对应名称时才导入（PEP 562），
+只用到其中一个中间件时不必加载其余模块及其依赖
+"""
 
-from .trace_middleware import (
-    trace_model_call,
-    trace_model_call_async,
-    trace_tool_call,
-)
+import importlib
 
-from .ui_events_middleware import (
-    ui_model_trace,
-    ui_tool_trace,
-    RUN_UI_EVENTS,
-    CURRENT_QUESTION,
-)
+# 导出名称 -> 所在子模块
+_EXPORTS = {
+    'trace_model_call': '.trace_middleware',
+    'trace_tool_call': '.trace_middleware',
+    'ui_model_trace': '.ui_events_middleware',
+    'ui_tool_trace': '.ui_events_middleware',
+    'RUN_UI_EVENTS': '.ui_events_middleware',
+    'CURRENT_QUESTION': '.ui_events_middleware',
+}
 
 __all__ = [
     'trace_model_call',
-    'trace_model_call_async',
     'trace_tool_call',
     'ui_model_trace',
     'ui_tool_trace',
     'RUN_UI_EVENTS',
     'CURRENT_QUESTION',
 ]
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
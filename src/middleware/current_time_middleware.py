@@ -0,0 +1,40 @@
+"""
+当前日期注入中间件
+系统提示词里保留 {CURRENT_TIME} 占位符，每次调用模型前再替换成当天日期，
+编译好的 agent 图可以长期复用，日期也不会停留在构建当天
+"""
+
+from typing import Awaitable, Callable
+
+from langchain.agents.middleware import AgentMiddleware, ModelRequest, ModelResponse  # type: ignore
+
+from src.utils.time_utils import CURRENT_TIME_PLACEHOLDER, fill_current_time
+
+
+class CurrentTimePromptMiddleware(AgentMiddleware):
+    """
+    日期注入中间件
+
+    放在中间件栈最外层：其他中间件追加内容前先替换占位符；
+    提示词里没有占位符时直接透传。
+    """
+
+    def _apply(self, request: ModelRequest) -> ModelRequest:
+        system_prompt = request.system_prompt
+        if not system_prompt or CURRENT_TIME_PLACEHOLDER not in system_prompt:
+            return request
+        return request.override(system_prompt=fill_current_time(system_prompt))
+
+    def wrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], ModelResponse],
+    ) -> ModelResponse:
+        return handler(self._apply(request))
+
+    async def awrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], Awaitable[ModelResponse]],
+    ) -> ModelResponse:
+        return await handler(self._apply(request))
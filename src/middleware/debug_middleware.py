@@ -14,14 +14,14 @@ class ToolMonitoringMiddleware(AgentMiddleware):
         request: ToolCallRequest,
         handler: Callable[[ToolCallRequest], ToolMessage | Command],
     ) -> ToolMessage | Command:
-        logger.info(f"Executing tool: {request.tool_call['name']}")
-        logger.info(f"Arguments: {request.tool_call['args']}")
+        logger.info("Executing tool: {}", request.tool_call['name'])
+        logger.info("Arguments: {}", request.tool_call['args'])
         try:
             result = handler(request)
-            logger.info(f"Tool completed successfully")
+            logger.info("Tool completed successfully")
             return result
         except Exception as e:
-            logger.error(f"Tool failed: {e}")
+            logger.error("Tool failed: {}", e)
             raise
 
 # ============================================================================
@@ -44,34 +44,24 @@ class LoggingMiddleware(AgentMiddleware): # ✅ 类名随意
 
     before_model: 模型调用前执行
     after_model: 模型响应后执行
+
+    只做日志、不涉及 I/O 等待，只实现同步钩子；
+    异步运行（ainvoke/astream）时 agent 同样会调用这两个同步钩子
     """
 
     def before_model(self, state, runtime):
         """模型调用前"""
         logger.info("\n[中间件] before_model: 准备调用模型")
-        logger.info(f"[中间件] 当前消息数: {len(state.get('messages', []))}")
+        # loguru 的 {} 参数在日志被过滤时不会格式化
+        logger.info("[中间件] 当前消息数: {}", len(state.get('messages', [])))
         return None  # 返回 None 表示继续正常流程
 
     def after_model(self, state, runtime):
         """模型响应后"""
         logger.info("[中间件] after_model: 模型已响应")
         last_message = state.get('messages', [])[-1]
-        logger.info(f"[中间件] 响应类型: {last_message.__class__.__name__}")    
-        #logger.info(f"[中间件] 消耗 tokens: {runtime.get('usage', {}).get('total_tokens', 0)}")
-        return None  # 返回 None 表示不修改状态
-
-    async def abefore_model(self, state, runtime):
-        """模型调用前"""
-        logger.info("\n[中间件] before_model: 准备调用模型")
-        logger.info(f"[中间件] 当前消息数: {len(state.get('messages', []))}")
-        return None  # 返回 None 表示继续正常流程
-
-    async def aafter_model(self, state, runtime):
-        """模型响应后"""
-        logger.info("[中间件] after_model: 模型已响应")
-        last_message = state.get('messages', [])[-1]
-        logger.info(f"[中间件] 响应类型: {last_message.__class__.__name__}")
-        #logger.info(f"[中间件] 消耗 tokens: {runtime.get('usage', {}).get('total_tokens', 0)}")
+        logger.info("[中间件] 响应类型: {}", last_message.__class__.__name__)    
+        #logger.info("[中间件] 消耗 tokens: {}", runtime.get('usage', {}).get('total_tokens', 0))
         return None  # 返回 None 表示不修改状态
 
 
@@ -92,7 +82,7 @@ class CallCounterMiddleware(AgentMiddleware):
     def after_model(self, state, runtime):
         """模型响应后，增加计数"""
         self.count += 1
-        logger.info(f"\n[计数器] 模型调用次数: {self.count}")
+        logger.info("\n[计数器] 模型调用次数: {}", self.count)
         return None  # 不修改 state
 
 # ============================================================================
@@ -119,7 +109,7 @@ class MessageTrimmerMiddleware(AgentMiddleware):
             # 保留最近的 N 条消息
             trimmed_messages = messages[-self.max_messages:]
             self.trimmed_count += 1
-            logger.info(f"\n[修剪] 消息从 {len(messages)} 条减少到 {len(trimmed_messages)} 条 (第{self.trimmed_count}次修剪)")
+            logger.info("\n[修剪] 消息从 {} 条减少到 {} 条 (第{}次修剪)", len(messages), len(trimmed_messages), self.trimmed_count)
             return {"messages": trimmed_messages}
 
         return None
@@ -149,7 +139,7 @@ class OutputValidationMiddleware(AgentMiddleware):
         content = getattr(last_message, 'content', '')
 
         if len(content) > self.max_length:
-            logger.warning(f"\n[警告] 响应内容过长 ({len(content)} 字符)，已截断到 {self.max_length}")
+            logger.warning("\n[警告] 响应内容过长 ({} 字符)，已截断到 {}", len(content), self.max_length)
             # 这里可以实现截断或重试逻辑
 
         return None
@@ -191,11 +181,11 @@ class MaxCallsMiddleware(AgentMiddleware):
     def before_model(self, state, runtime):
         """检查调用次数，超过限制则抛出异常"""
         if self.count >= self.max_calls:
-            logger.warning(f"\n[限制] 已达到最大调用次数 {self.max_calls}，停止调用")
+            logger.warning("\n[限制] 已达到最大调用次数 {}，停止调用", self.max_calls)
             # 抛出自定义异常来阻止继续执行
             raise ValueError(f"已达到最大调用次数限制: {self.max_calls}")
 
-        logger.info(f"[限制] 当前调用次数: {self.count}/{self.max_calls}")
+        logger.info("[限制] 当前调用次数: {}/{}", self.count, self.max_calls)
         return None
 
     def after_model(self, state, runtime):
@@ -0,0 +1,91 @@
+"""
+Anthropic 提示缓存断点中间件
+在最终发往模型的工具定义和 system prompt 上放置 cache_control 断点，
+让静态的工具 schema 和系统提示词前缀命中 Anthropic 的前缀缓存
+"""
+
+from typing import Any, Awaitable, Callable
+
+from langchain.agents.middleware import AgentMiddleware, ModelRequest, ModelResponse  # type: ignore
+from langchain_anthropic.chat_models import convert_to_anthropic_tool
+from langchain_core.messages import SystemMessage
+from langchain_core.tools import BaseTool
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def is_anthropic_model(model: Any) -> bool:
+    """判断模型（实例或 "provider:model" 字符串）是否由 Anthropic 提供"""
+    if isinstance(model, str):
+        return model.startswith(("anthropic:", "claude"))
+    return type(model).__module__.startswith("langchain_anthropic")
+
+
+def _mark_system_message(system_message: SystemMessage) -> SystemMessage:
+    """在 system message 的最后一个文本块上放置 cache_control 断点"""
+    content = system_message.content
+    if isinstance(content, str):
+        blocks = [{"type": "text", "text": content}]
+    else:
+        blocks = [
+            {"type": "text", "text": block} if isinstance(block, str) else dict(block)
+            for block in content
+        ]
+    for block in reversed(blocks):
+        if block.get("type") == "text":
+            block["cache_control"] = CACHE_CONTROL
+            break
+    return SystemMessage(content=blocks)
+
+
+def _mark_last_tool_cacheable(tools: list) -> list:
+    """把最后一个工具转换为 Anthropic 工具定义并放置 cache_control 断点
+
+    工具名保持不变，执行仍由 ToolNode 中注册的原始工具完成。
+    """
+    if not tools:
+        return tools
+    last = tools[-1]
+    if isinstance(last, BaseTool):
+        last = convert_to_anthropic_tool(last)
+    elif isinstance(last, dict):
+        last = dict(last)
+    else:
+        return tools
+    last["cache_control"] = CACHE_CONTROL
+    return [*tools[:-1], last]
+
+
+class AnthropicCacheBreakpointMiddleware(AgentMiddleware):
+    """
+    提示缓存断点中间件
+
+    其他中间件（Filesystem、SubAgent 等）会把 system prompt 重新拼接成纯字符串，
+    并追加自己的工具，因此断点必须在最内层、即将调用模型时放置。
+    AnthropicPromptCachingMiddleware 只给最后一条消息加断点，这里补上
+    工具定义和 system 两个断点。非 Anthropic 模型直接透传。
+    """
+
+    def _apply(self, request: ModelRequest) -> ModelRequest:
+        if not is_anthropic_model(request.model):
+            return request
+        overrides = {}
+        if request.tools:
+            overrides["tools"] = _mark_last_tool_cacheable(request.tools)
+        if request.system_message is not None:
+            overrides["system_message"] = _mark_system_message(request.system_message)
+        return request.override(**overrides) if overrides else request
+
+    def wrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], ModelResponse],
+    ) -> ModelResponse:
+        return handler(self._apply(request))
+
+    async def awrap_model_call(
+        self,
+        request: ModelRequest,
+        handler: Callable[[ModelRequest], Awaitable[ModelResponse]],
+    ) -> ModelResponse:
+        return await handler(self._apply(request))
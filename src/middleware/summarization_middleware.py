@@ -0,0 +1,79 @@
+"""
+带缓存的摘要中间件
+相同的待摘要消息前缀直接复用上一次的摘要，避免重试、检查点回放时重复调用 LLM
+"""
+
+import hashlib
+from collections import OrderedDict
+
+from langchain.agents.middleware.summarization import SummarizationMiddleware
+from langchain_core.messages import AIMessage, AnyMessage, ToolMessage
+
+SUMMARY_CACHE_SIZE = 128
+# SummarizationMiddleware 把摘要失败也作为字符串返回，这类结果不缓存
+SUMMARY_ERROR_PREFIX = "Error generating summary:"
+
+
+def _messages_key(messages: list[AnyMessage]) -> str:
+    """按消息类型、内容及工具调用信息计算待摘要窗口的哈希
+
+    AIMessage 可能只有 tool_calls 而内容为空，ToolMessage 靠 tool_call_id/name
+    区分，这些字段都要计入，否则不同窗口会得到同一个 key。
+    """
+    digest = hashlib.blake2b()
+    for msg in messages:
+        content = msg.content if isinstance(msg.content, str) else repr(msg.content)
+        parts = [msg.type, content]
+        if isinstance(msg, AIMessage) and msg.tool_calls:
+            parts.append(repr([(tc["id"], tc["name"], tc["args"]) for tc in msg.tool_calls]))
+        elif isinstance(msg, ToolMessage):
+            parts.extend((msg.tool_call_id, msg.name or ""))
+        for part in parts:
+            digest.update(part.encode())
+            digest.update(b"\0")
+        digest.update(b"\1")
+    return digest.hexdigest()
+
+
+class CachedSummarizationMiddleware(SummarizationMiddleware):
+    """
+    摘要缓存中间件
+
+    在 SummarizationMiddleware 的摘要步骤外包一层 LRU 缓存（按消息窗口哈希），
+    命中时不再发起摘要 LLM 调用。
+    """
+
+    def __init__(self, *args, cache_size: int = SUMMARY_CACHE_SIZE, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_size = cache_size
+        self._summary_cache: OrderedDict[str, str] = OrderedDict()
+
+    def _get_cached(self, key: str) -> str | None:
+        summary = self._summary_cache.get(key)
+        if summary is not None:
+            self._summary_cache.move_to_end(key)
+        return summary
+
+    def _put_cached(self, key: str, summary: str) -> None:
+        if summary.startswith(SUMMARY_ERROR_PREFIX):
+            return
+        self._summary_cache[key] = summary
+        self._summary_cache.move_to_end(key)
+        while len(self._summary_cache) > self.cache_size:
+            self._summary_cache.popitem(last=False)
+
+    def _create_summary(self, messages_to_summarize: list[AnyMessage]) -> str:
+        key = _messages_key(messages_to_summarize)
+        summary = self._get_cached(key)
+        if summary is None:
+            summary = super()._create_summary(messages_to_summarize)
+            self._put_cached(key, summary)
+        return summary
+
+    async def _acreate_summary(self, messages_to_summarize: list[AnyMessage]) -> str:
+        key = _messages_key(messages_to_summarize)
+        summary = self._get_cached(key)
+        if summary is None:
+            summary = await super()._acreate_summary(messages_to_summarize)
+            self._put_cached(key, summary)
+        return summary
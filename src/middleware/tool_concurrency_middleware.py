@@ -0,0 +1,162 @@
+"""
+工具并发控制中间件
+按工具是否并发安全划分：只读工具并发执行，有副作用的工具串行执行
+"""
+
+import asyncio
+import threading
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+
+from langchain.agents.middleware import AgentMiddleware  # type: ignore
+from langchain.messages import AIMessage, ToolMessage
+from langchain.tools.tool_node import ToolCallRequest
+from langgraph.types import Command
+
+# 并发安全（只读、无共享状态）的工具
+# 可通过工具的 metadata={"concurrency_safe": bool} 覆盖
+CONCURRENCY_SAFE_TOOLS = frozenset({
+    "web_search",
+    "crawl_tool",
+    "think_tool",
+    "local_search_tool",
+    "ls",
+    "read_file",
+    "glob",
+    "grep",
+    "task",
+})
+
+# 派发子智能体的工具名（deepagents SubAgentMiddleware）
+SUBAGENT_TOOL_NAME = "task"
+
+
+def _batch_key(request: ToolCallRequest) -> str | int:
+    """同一条 AIMessage 发出的 tool_calls 属于同一批，以该消息作为批次标识"""
+    for msg in reversed((request.state or {}).get("messages", [])):
+        if isinstance(msg, AIMessage):
+            return msg.id or id(msg)
+    return request.tool_call["id"]
+
+
+class _BatchSlots:
+    """一批 tool_calls 共用的串行锁和子智能体信号量，最后一个调用结束后丢弃"""
+
+    def __init__(self, lock, semaphore):
+        self.lock = lock
+        self.semaphore = semaphore
+        self.users = 0
+
+
+class ConcurrentToolExecutorMiddleware(AgentMiddleware):
+    """
+    工具并发执行中间件
+
+    同一轮模型输出的多个 tool_calls 会被 LangGraph 拆成多个任务并发执行，
+    这对搜索、爬取这类只读工具正是我们想要的；但 python_repl、文件写入等
+    共享状态的工具并发执行会互相干扰。
+
+    这里让并发安全的工具直接放行，其余工具在同一把锁下依次执行，
+    相当于把一批 tool_calls 划分为“并发的只读组”和“串行的写组”。
+
+    设置 max_concurrent_subagents 时，同时运行的子智能体（task 工具）
+    数量不超过该值，多出的调用排队等待。
+
+    中间件实例会在多个 agent 运行之间共享，因此锁和信号量按批次
+    （发出 tool_calls 的那条 AIMessage）创建，不同运行、不同用户互不阻塞；
+    异步的锁和信号量还按事件循环分开，避免跨 asyncio.run 复用。
+    """
+
+    def __init__(
+        self,
+        concurrency_safe_tools: Iterable[str] = CONCURRENCY_SAFE_TOOLS,
+        max_concurrent_subagents: int | None = None,
+    ):
+        super().__init__()
+        self.concurrency_safe_tools = frozenset(concurrency_safe_tools)
+        self.max_concurrent_subagents = max_concurrent_subagents
+        self._sync_batches: dict[str | int, _BatchSlots] = {}
+        self._sync_batches_lock = threading.Lock()
+        self._async_batches: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str | int, _BatchSlots]
+        ] = weakref.WeakKeyDictionary()
+
+    @contextmanager
+    def _sync_batch(self, key: str | int) -> Iterator[_BatchSlots]:
+        """取出（或创建）同步执行时这一批调用共用的锁和信号量"""
+        with self._sync_batches_lock:
+            slots = self._sync_batches.get(key)
+            if slots is None:
+                slots = self._sync_batches[key] = _BatchSlots(
+                    threading.Lock(),
+                    threading.BoundedSemaphore(self.max_concurrent_subagents)
+                    if self.max_concurrent_subagents
+                    else None,
+                )
+            slots.users += 1
+        try:
+            yield slots
+        finally:
+            with self._sync_batches_lock:
+                slots.users -= 1
+                if not slots.users:
+                    del self._sync_batches[key]
+
+    @asynccontextmanager
+    async def _async_batch(self, key: str | int) -> AsyncIterator[_BatchSlots]:
+        """取出（或创建）当前事件循环里这一批调用共用的锁和信号量"""
+        batches = self._async_batches.setdefault(asyncio.get_running_loop(), {})
+        slots = batches.get(key)
+        if slots is None:
+            slots = batches[key] = _BatchSlots(
+                asyncio.Lock(),
+                asyncio.Semaphore(self.max_concurrent_subagents)
+                if self.max_concurrent_subagents
+                else None,
+            )
+        slots.users += 1
+        try:
+            yield slots
+        finally:
+            slots.users -= 1
+            if not slots.users:
+                del batches[key]
+
+    def _is_bounded_subagent(self, request: ToolCallRequest) -> bool:
+        """判断是否为受并发上限约束的子智能体调用"""
+        return (
+            self.max_concurrent_subagents is not None
+            and request.tool_call["name"] == SUBAGENT_TOOL_NAME
+        )
+
+    def _is_concurrency_safe(self, request: ToolCallRequest) -> bool:
+        """判断工具是否可以并发执行"""
+        metadata = getattr(request.tool, "metadata", None) or {}
+        if "concurrency_safe" in metadata:
+            return bool(metadata["concurrency_safe"])
+        return request.tool_call["name"] in self.concurrency_safe_tools
+
+    def wrap_tool_call(
+        self,
+        request: ToolCallRequest,
+        handler: Callable[[ToolCallRequest], ToolMessage | Command],
+    ) -> ToolMessage | Command:
+        bounded = self._is_bounded_subagent(request)
+        if not bounded and self._is_concurrency_safe(request):
+            return handler(request)
+        with self._sync_batch(_batch_key(request)) as slots:
+            with slots.semaphore if bounded else slots.lock:
+                return handler(request)
+
+    async def awrap_tool_call(
+        self,
+        request: ToolCallRequest,
+        handler: Callable[[ToolCallRequest], Awaitable[ToolMessage | Command]],
+    ) -> ToolMessage | Command:
+        bounded = self._is_bounded_subagent(request)
+        if not bounded and self._is_concurrency_safe(request):
+            return await handler(request)
+        async with self._async_batch(_batch_key(request)) as slots:
+            async with slots.semaphore if bounded else slots.lock:
+                return await handler(request)
@@ -12,6 +12,27 @@ from langchain.agents.middleware import wrap_model_call, wrap_tool_call  # type:
 from langchain.agents.middleware import ModelRequest, ModelResponse  # type: ignore
 from langchain_core.messages import AIMessage  # type: ignore
 
+# 需要精简打印的工具
+COMPACT_TOOLS = frozenset({"get_all_tables_info", "get_table_schema"})
+
+
+def get_request_messages(request: ModelRequest) -> list:
+    """取出本次模型调用的消息；request.messages 为空时回退到 agent state"""
+    if request.messages:
+        return request.messages
+    state = request.state or {}
+    return state.get("messages", [])
+
+
+def get_response_message(resp: ModelResponse | AIMessage) -> AIMessage | None:
+    """取出模型返回的 AIMessage；handler 返回 ModelResponse 时取 result 中最后一条 AIMessage"""
+    if isinstance(resp, AIMessage):
+        return resp
+    for msg in reversed(resp.result):
+        if isinstance(msg, AIMessage):
+            return msg
+    return None
+
 
 def _print_message(i, msg):
     """打印单条消息的辅助函数"""
@@ -27,7 +48,9 @@ def _print_message(i, msg):
         logger.info(f"[{i}] AI:\n{content[:100] if content else '(tool calls only)'}{'...' if len(content) > 100 else ''}\n")
     elif msg_type == 'tool':
         tool_name = getattr(msg, 'name', 'unknown')
-        logger.info(f"[{i}] Tool ({tool_name}):\n{str(content)[:100]}{'...' if len(str(content)) > 100 else ''}\n")
+        # 工具输出可能很大，只转一次字符串
+        text = str(content)
+        logger.info(f"[{i}] Tool ({tool_name}):\n{text[:100]}{'...' if len(text) > 100 else ''}\n")
 
 
 @wrap_model_call
@@ -36,15 +59,10 @@ def trace_model_call(
     handler: Callable[[ModelRequest], ModelResponse],
 ) -> ModelResponse:
     """拦截 LLM 调用，记录输入/输出/耗时"""
-    t0 = time.time()
+    t0 = time.perf_counter()
     
     # 从 request 中获取 messages
-    messages = getattr(request, "messages", [])
-    if not messages:
-        # 尝试从 runtime 中获取
-        runtime = getattr(request, "runtime", None)
-        if runtime and hasattr(runtime, "state"):
-            messages = runtime.state.get("messages", [])
+    messages = get_request_messages(request)
     logger.info("[LLM START]")
     
     # 注意：此次是日志显示的逻辑
@@ -66,12 +84,12 @@ def trace_model_call(
     # 执行真正的模型调用
     resp = handler(request)
     
-    dt = (time.time() - t0) * 1000
+    dt = (time.perf_counter() - t0) * 1000
     logger.info(f"\n [LLM END] {dt:.1f} ms")
     
     # 打印 AI 响应
-    ai_message = getattr(resp, "message", resp)
-    if isinstance(ai_message, AIMessage):
+    ai_message = get_response_message(resp)
+    if ai_message is not None:
         content = ai_message.content or ""
         logger.info(f"AIMessage content:\n{content[:100]}{'...' if len(content) > 100 else ''}")
         if getattr(ai_message, "tool_calls", None):
@@ -82,7 +100,7 @@ def trace_model_call(
                 args_str = json.dumps(args, ensure_ascii=False, indent=2)
                 logger.info(f" Args: {args_str[:100]}{'...' if len(args_str) > 100 else ''}")
     else:
-        logger.info(f"Raw output:\n{str(ai_message)[:100]}")
+        logger.info(f"Raw output:\n{str(resp)[:100]}")
     
     return resp
 
@@ -98,17 +116,10 @@ def trace_tool_call(
     其他工具显示详细输出
     """
     # 从 request 中提取工具名和参数
-    tool_call = getattr(request, "tool_call", None)
-    if tool_call:
-        tool_name = tool_call.get("name", "unknown")
-        tool_input = tool_call.get("args", {})
-    else:
-        tool_name = getattr(request, "tool_name", "unknown")
-        tool_input = getattr(request, "tool_input", {})
-    
-    # 定义需要精简打印的工具
-    compact_tools = {"get_all_tables_info", "get_table_schema"}
-    is_compact = tool_name in compact_tools
+    tool_name = request.tool_call.get("name", "unknown")
+    tool_input = request.tool_call.get("args", {})
+
+    is_compact = tool_name in COMPACT_TOOLS
 
     logger.info(f"[TOOL START] {tool_name}")
 
@@ -116,9 +127,9 @@ def trace_tool_call(
     args_str = json.dumps(tool_input, ensure_ascii=False, indent=2)
     logger.info(f"Args:\n{args_str[:600]}{'...' if len(args_str) > 600 else ''}")
     
-    t0 = time.time()
+    t0 = time.perf_counter()
     result = handler(request)
-    dt = (time.time() - t0) * 1000
+    dt = (time.perf_counter() - t0) * 1000
     
     logger.info(f"\n[TOOL END] {dt:.1f} ms")
     
@@ -8,13 +8,14 @@ UI 事件中间件
 import json
 import time
 import contextvars
+from types import MappingProxyType
 from typing import Callable, Any, List, Dict
 from langchain.agents.middleware import wrap_model_call, wrap_tool_call # type: ignore
 from langchain.agents.middleware import ModelRequest, ModelResponse # type: ignore
-from langchain_core.messages import AIMessage # type: ignore
 
 from src.config.logger import get_logger
 from src.llms.llm import get_llm_by_type
+from src.middleware.trace_middleware import get_request_messages, get_response_message
 logger = get_logger(__name__)
 
 # 在一次 agent run 的上下文里累计工具事件
@@ -89,23 +90,25 @@ def _generate_tool_description_by_llm(
     
     except Exception as e:
         # LLM 调用失败，降级到默认描述
-        logger.warning(f"生成工具描述失败: {e}")
-        import traceback
-        traceback.print_exc()
+        # 堆栈随日志记录交给 enqueue 的 sink 写出，不在工具调用路径上同步打印到 stderr
+        logger.opt(exception=e).warning(f"生成工具描述失败: {e}")
         return _get_fallback_description(tool_name, args)
 
 
+# 降级描述：工具名 -> 默认描述
+FALLBACK_TOOL_DESCRIPTIONS = MappingProxyType({
+    'check_mysql_version': '检查数据库版本',
+    'get_all_tables_info': '获取表信息',
+    'get_table_schema': '分析表结构',
+    'generate_sql': '生成SQL查询',
+    'validate_sql_syntax': '验证SQL语法',
+    'execute_sql': '执行数据库查询',
+})
+
+
 def _get_fallback_description(tool_name: str, args: dict) -> str:
     """降级方案：使用简单映射生成描述"""
-    tool_map = {
-        'check_mysql_version': '检查数据库版本',
-        'get_all_tables_info': '获取表信息',
-        'get_table_schema': '分析表结构',
-        'generate_sql': '生成SQL查询',
-        'validate_sql_syntax': '验证SQL语法',
-        'execute_sql': '执行数据库查询',
-    }
-    return tool_map.get(tool_name, f'执行{tool_name}')
+    return FALLBACK_TOOL_DESCRIPTIONS.get(tool_name, f'执行{tool_name}')
 
 
 # 1) 工具调用中间件：使用 LLM 生成简述
@@ -117,18 +120,13 @@ def ui_tool_trace(
     """拦截工具调用，使用 LLM 生成 UI 事件描述"""
     
     # 从 request 中提取工具名和参数
-    tool_call = getattr(request, "tool_call", None)
-    if tool_call:
-        tool_name = tool_call.get("name", "unknown")
-        tool_args = tool_call.get("args", {})
-    else:
-        tool_name = getattr(request, "tool_name", "unknown")
-        tool_args = getattr(request, "tool_input", {})
+    tool_name = request.tool_call.get("name", "unknown")
+    tool_args = request.tool_call.get("args", {})
     
     # 获取用户问题
     user_question = CURRENT_QUESTION.get() or "未知问题"
     
-    t0 = time.time()
+    t0 = time.perf_counter()
     
     # 使用 LLM 生成友好描述（包含原因）
     description = _generate_tool_description_by_llm(tool_name, tool_args, user_question)
@@ -148,7 +146,7 @@ def ui_tool_trace(
     result = handler(request)
     
     # 记录结束事件
-    dt = (time.time() - t0) * 1000
+    dt = (time.perf_counter() - t0) * 1000
     
     # 提取输出内容
     if hasattr(result, "content"):
@@ -196,12 +194,8 @@ def ui_model_trace(
 ) -> ModelResponse:
     """拦截 LLM 调用，在 AIMessage 上注入 ui_events，并提取用户问题"""
     
-    # 提取用户问题（从 request.messages 或 request.runtime.state.messages 中找 human 消息）
-    messages = getattr(request, "messages", [])
-    if not messages:
-        runtime = getattr(request, "runtime", None)
-        if runtime and hasattr(runtime, "state"):
-            messages = runtime.state.get("messages", [])
+    # 提取用户问题（从 request.messages 或 request.state 的 messages 中找 human 消息）
+    messages = get_request_messages(request)
     
     # 存入 CURRENT_QUESTION 上下文变量。
     for msg in messages:
@@ -214,17 +208,17 @@ def ui_model_trace(
     RUN_UI_EVENTS.set([])
     
     # 执行模型
-    t0 = time.time()
+    t0 = time.perf_counter()
     # 实际调用模型
     resp = handler(request)
-    dt = (time.time() - t0) * 1000
+    dt = (time.perf_counter() - t0) * 1000
     
-    # 在模型调用后，取出返回的 AIMessage（或从 resp.message 获取），
+    # 在模型调用后，取出返回的 AIMessage（从 ModelResponse.result 中获取），
     try:
-        ai_msg = getattr(resp, "message", resp)
+        ai_msg = get_response_message(resp)
         
         # 构造一个 ui_events 字段
-        if isinstance(ai_msg, AIMessage):
+        if ai_msg is not None:
             extra = dict(ai_msg.additional_kwargs or {})
             events = RUN_UI_EVENTS.get()
             # 把之前累计的 “工具开始／结束” 事件，+ 本次模型完成事件 (kind="llm_end") 放进去
@@ -1,4 +1,5 @@
 import dataclasses
+import functools
 import os
 from datetime import datetime
 
@@ -16,10 +17,14 @@ env = Environment(
 )
 
 
+@functools.lru_cache(maxsize=None)
 def get_prompt_template(prompt_name: str, locale: str = "zh-CN") -> str:
     """
     Load and return a prompt template using Jinja2 with locale support.
 
+    Templates are rendered without variables, so the result is cached for the
+    life of the process.
+
     Args:
         prompt_name: Name of the prompt template file (without .md extension)
         locale: Language locale (e.g., en-US, zh-CN). Defaults to zh-CN
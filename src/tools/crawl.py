@@ -1,12 +1,16 @@
 # Copyright (c) 2025 Bytedance Ltd. and/or its affiliates
 # SPDX-License-Identifier: MIT
 
+import asyncio
 import json
 import logging
+import threading
+import time
+from collections import OrderedDict
 from typing import Annotated, Optional
 from urllib.parse import urlparse
 
-from langchain_core.tools import tool
+from langchain_core.tools import StructuredTool
 
 from src.crawler import Crawler
 
@@ -14,6 +18,43 @@ from .decorators import log_io
 
 logger = logging.getLogger(__name__)
 
+# Crawled pages are reused for a while: sub-agents often revisit the same
+# sources within one research run.
+CRAWL_CACHE_SIZE = 512
+CRAWL_CACHE_TTL_SECONDS = 600
+
+_crawl_cache: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+# The sync tool runs in LangGraph's thread pool, so cache updates are locked
+_crawl_cache_lock = threading.Lock()
+# Concurrent async crawls of the same URL share one fetch
+_inflight: dict[str, asyncio.Future] = {}
+
+
+def _cache_get(url: str) -> Optional[str]:
+    with _crawl_cache_lock:
+        entry = _crawl_cache.get(url)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > CRAWL_CACHE_TTL_SECONDS:
+            del _crawl_cache[url]
+            return None
+        _crawl_cache.move_to_end(url)
+        return result
+
+
+def _cache_put(url: str, result: str) -> None:
+    with _crawl_cache_lock:
+        _crawl_cache[url] = (time.monotonic(), result)
+        _crawl_cache.move_to_end(url)
+        while len(_crawl_cache) > CRAWL_CACHE_SIZE:
+            _crawl_cache.popitem(last=False)
+
+
+def _article_result(url: str, article) -> str:
+    return json.dumps({"url": url, "crawled_content": article.to_markdown()[:1000]})
+
+
 def is_pdf_url(url: Optional[str]) -> bool:
     """Check if the URL points to a PDF file."""
     if not url:
@@ -23,28 +64,92 @@ def is_pdf_url(url: Optional[str]) -> bool:
     return parsed_url.path.lower().endswith('.pdf')
 
 
-@tool
+def _pdf_message(url: str) -> str:
+    logger.info(f"PDF URL detected, skipping crawling: {url}")
+    return json.dumps({
+        "url": url,
+        "error": "PDF files cannot be crawled directly. Please download and view the PDF manually.",
+        "crawled_content": None,
+        "is_pdf": True
+    })
+
+
 @log_io
-def crawl_tool(
+def _crawl(
     url: Annotated[str, "The url to crawl."],
 ) -> str:
-    """Use this to crawl a url and get a readable content in markdown format."""
     # Special handling for PDF URLs
     if is_pdf_url(url):
-        logger.info(f"PDF URL detected, skipping crawling: {url}")
-        pdf_message = json.dumps({
-            "url": url,
-            "error": "PDF files cannot be crawled directly. Please download and view the PDF manually.",
-            "crawled_content": None,
-            "is_pdf": True
-        })
-        return pdf_message
+        return _pdf_message(url)
     
+    cached = _cache_get(url)
+    if cached is not None:
+        return cached
+
     try:
         crawler = Crawler()
-        article = crawler.crawl(url)
-        return json.dumps({"url": url, "crawled_content": article.to_markdown()[:1000]})
+        result = _article_result(url, crawler.crawl(url))
+        _cache_put(url, result)
+        return result
     except BaseException as e:
         error_msg = f"Failed to crawl. Error: {repr(e)}"
         logger.error(error_msg)
         return error_msg
+
+
+@log_io
+async def _acrawl(
+    url: Annotated[str, "The url to crawl."],
+) -> str:
+    # Async runs dispatch parallel crawl_tool calls concurrently; they share
+    # the pooled client in JinaClient instead of opening a connection each.
+    if is_pdf_url(url):
+        return _pdf_message(url)
+
+    cached = _cache_get(url)
+    if cached is not None:
+        return cached
+
+    loop = asyncio.get_running_loop()
+    while True:
+        future = _inflight.get(url)
+        if future is None or future.get_loop() is not loop:
+            break
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # Only this caller's own cancellation propagates; if the leading
+            # crawl was cancelled, join a newer one or fetch the page here.
+            if not future.cancelled():
+                raise
+        except Exception as e:
+            return f"Failed to crawl. Error: {repr(e)}"
+
+    future = loop.create_future()
+    _inflight[url] = future
+    try:
+        crawler = Crawler()
+        result = _article_result(url, await crawler.acrawl(url))
+        _cache_put(url, result)
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        # Mark the exception retrieved in case no other caller was waiting
+        future.exception()
+        error_msg = f"Failed to crawl. Error: {repr(e)}"
+        logger.error(error_msg)
+        return error_msg
+    finally:
+        if _inflight.get(url) is future:
+            del _inflight[url]
+        if not future.done():
+            future.cancel()
+
+
+crawl_tool = StructuredTool.from_function(
+    func=_crawl,
+    coroutine=_acrawl,
+    name="crawl_tool",
+    description="Use this to crawl a url and get a readable content in markdown format.",
+)
@@ -50,7 +50,7 @@ async def crawl4ai_tool(urls: list[str]) -> dict:
     参数:
         urls: URL字符串列表，例如 ["https://example.com"]
     """
-    print(f'crawl4ai_tool收到的完整输入: {urls}\n')
+    logger.debug(f'crawl4ai_tool收到的完整输入: {urls}')
     result = await quick_crawl_tool(urls)
     return {"result": result}
 
@@ -1,5 +1,6 @@
 # src/utils/token_manager.py
 import copy
+import json
 from src.config.logger import get_logger
 from typing import List
 
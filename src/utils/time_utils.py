@@ -0,0 +1,46 @@
+"""
+Time helpers shared by prompt building and logging.
+"""
+
+import time
+from datetime import datetime
+
+# Seconds a formatted date is reused before it is recomputed
+TODAY_TTL_SECONDS = 60
+
+# Placeholder kept in long-lived prompts and filled in at call time
+CURRENT_TIME_PLACEHOLDER = "{CURRENT_TIME}"
+
+_today: str = ""
+_today_checked_at: float = float("-inf")
+
+
+def today_str() -> str:
+    """
+    Return today's date as YYYY-MM-DD, recomputed at most once a minute.
+
+    Unlike a value formatted at import time, this rolls over at midnight in
+    long-running processes.
+
+    Returns:
+        str: The current local date
+    """
+    global _today, _today_checked_at
+    now = time.monotonic()
+    if now - _today_checked_at > TODAY_TTL_SECONDS:
+        _today = datetime.now().strftime("%Y-%m-%d")
+        _today_checked_at = now
+    return _today
+
+
+def fill_current_time(text: str) -> str:
+    """
+    Replace the {CURRENT_TIME} placeholder in a prompt with today's date.
+
+    Args:
+        text: Prompt text that may contain the placeholder
+
+    Returns:
+        str: The prompt with the placeholder filled in
+    """
+    return text.replace(CURRENT_TIME_PLACEHOLDER, today_str())
@@ -0,0 +1,130 @@
+import asyncio
+import json
+
+import pytest
+
+from src.tools import crawl
+
+
+class _Article:
+    def __init__(self, url):
+        self.url = url
+
+    def to_markdown(self):
+        return f"# {self.url}"
+
+
+class _FakeCrawler:
+    """Counts fetches; async fetches wait on `release` so calls can overlap."""
+
+    calls = 0
+    release: asyncio.Event | None = None
+
+    def crawl(self, url):
+        type(self).calls += 1
+        return _Article(url)
+
+    async def acrawl(self, url):
+        type(self).calls += 1
+        if type(self).release is not None:
+            await type(self).release.wait()
+        return _Article(url)
+
+
+class _FailingCrawler:
+    calls = 0
+
+    def crawl(self, url):
+        type(self).calls += 1
+        raise RuntimeError("boom")
+
+
+@pytest.fixture(autouse=True)
+def fake_crawler(monkeypatch):
+    _FakeCrawler.calls = 0
+    _FakeCrawler.release = None
+    monkeypatch.setattr(crawl, "Crawler", _FakeCrawler)
+    crawl._crawl_cache.clear()
+    crawl._inflight.clear()
+    yield
+    crawl._crawl_cache.clear()
+    crawl._inflight.clear()
+
+
+def _crawled_content(result):
+    return json.loads(result)["crawled_content"]
+
+
+def test_repeated_crawl_is_served_from_cache():
+    first = crawl.crawl_tool.invoke({"url": "https://example.com/a"})
+    second = crawl.crawl_tool.invoke({"url": "https://example.com/a"})
+
+    assert first == second
+    assert _crawled_content(first) == "# https://example.com/a"
+    assert _FakeCrawler.calls == 1
+
+
+def test_cache_entry_expires_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(crawl.time, "monotonic", lambda: now[0])
+
+    crawl.crawl_tool.invoke({"url": "https://example.com/a"})
+    now[0] += crawl.CRAWL_CACHE_TTL_SECONDS - 1
+    crawl.crawl_tool.invoke({"url": "https://example.com/a"})
+    assert _FakeCrawler.calls == 1
+
+    now[0] += 2
+    crawl.crawl_tool.invoke({"url": "https://example.com/a"})
+    assert _FakeCrawler.calls == 2
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(crawl, "CRAWL_CACHE_SIZE", 2)
+
+    for path in ("a", "b"):
+        crawl.crawl_tool.invoke({"url": f"https://example.com/{path}"})
+    crawl.crawl_tool.invoke({"url": "https://example.com/a"})
+    crawl.crawl_tool.invoke({"url": "https://example.com/c"})
+
+    assert list(crawl._crawl_cache) == ["https://example.com/a", "https://example.com/c"]
+
+
+def test_failed_crawl_is_not_cached(monkeypatch):
+    _FailingCrawler.calls = 0
+    monkeypatch.setattr(crawl, "Crawler", _FailingCrawler)
+
+    for _ in range(2):
+        result = crawl.crawl_tool.invoke({"url": "https://example.com/a"})
+        assert result.startswith("Failed to crawl")
+    assert _FailingCrawler.calls == 2
+
+
+async def test_concurrent_async_crawls_share_one_fetch():
+    _FakeCrawler.release = asyncio.Event()
+    tasks = [
+        asyncio.create_task(crawl.crawl_tool.ainvoke({"url": "https://example.com/a"}))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    _FakeCrawler.release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert len(set(results)) == 1
+    assert _FakeCrawler.calls == 1
+    assert not crawl._inflight
+
+
+async def test_cancelled_leading_crawl_is_retried_by_a_waiter():
+    _FakeCrawler.release = asyncio.Event()
+    leader = asyncio.create_task(crawl.crawl_tool.ainvoke({"url": "https://example.com/a"}))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(crawl.crawl_tool.ainvoke({"url": "https://example.com/a"}))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    _FakeCrawler.release.set()
+
+    assert _crawled_content(await follower) == "# https://example.com/a"
+    assert leader.cancelled()
+    assert _FakeCrawler.calls == 2
@@ -0,0 +1,95 @@
+import asyncio
+import http.server
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.crawler import jina_client
+from src.crawler.jina_client import JinaClient
+
+
+class _ReaderHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = b"# page"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def reader_url(monkeypatch):
+    """Point JinaClient at a local keep-alive server instead of r.jina.ai."""
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _ReaderHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    monkeypatch.setattr(jina_client, "JINA_READER_URL", url)
+    monkeypatch.setenv("JINA_API_KEY", "test")
+    yield url
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_client_is_shared_within_a_loop():
+    async def get_twice():
+        return jina_client._get_async_client(), jina_client._get_async_client()
+
+    first, second = asyncio.run(get_twice())
+    assert first is second
+
+
+def test_async_client_is_not_shared_across_loops():
+    async def get_client():
+        return jina_client._get_async_client()
+
+    assert asyncio.run(get_client()) is not asyncio.run(get_client())
+
+
+def test_acrawl_works_across_event_loops(reader_url):
+    client = JinaClient()
+
+    # The second run used to reuse a pool bound to the first, closed loop
+    assert asyncio.run(client.acrawl("https://example.com")) == "# page"
+    assert asyncio.run(client.acrawl("https://example.com")) == "# page"
+
+
+@pytest.fixture
+def fresh_sync_client(monkeypatch):
+    monkeypatch.setattr(jina_client, "_client", None)
+
+
+def test_sync_client_is_shared_and_reopened_after_close(fresh_sync_client):
+    client = jina_client._get_client()
+    assert jina_client._get_client() is client
+
+    client.close()
+    assert jina_client._get_client() is not client
+
+
+def test_sync_client_is_created_once_across_threads(fresh_sync_client):
+    barrier = threading.Barrier(8)
+
+    def get_client(_):
+        barrier.wait()
+        return jina_client._get_client()
+
+    with ThreadPoolExecutor(8) as pool:
+        clients = set(pool.map(get_client, range(8)))
+
+    assert len(clients) == 1
+
+
+def test_crawl_reuses_the_shared_client(reader_url, fresh_sync_client):
+    client = JinaClient()
+
+    assert client.crawl("https://example.com/a") == "# page"
+    assert client.crawl("https://example.com/b") == "# page"
+    assert not jina_client._client.is_closed
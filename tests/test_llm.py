@@ -0,0 +1,55 @@
+import pytest
+
+from src.llms import llm
+
+
+@pytest.fixture
+def init_kwargs(monkeypatch):
+    """Capture the kwargs passed to init_chat_model instead of building a model."""
+    monkeypatch.setattr(llm, "init_chat_model", lambda **kwargs: kwargs)
+    monkeypatch.setattr(llm, "_get_env_llm_conf", lambda llm_type: {})
+
+
+def _conf(**section):
+    return {"BASIC_MODEL": {"model": "gpt-4o", "api_key": "test", **section}}
+
+
+def test_openai_models_share_pooled_clients(init_kwargs):
+    first = llm._create_llm_use_conf("basic", _conf(model_provider="openai"))
+    second = llm._create_llm_use_conf("basic", _conf(model_provider="openai"))
+
+    assert (first["http_client"], first["http_async_client"]) == llm._get_http_clients(True)
+    assert first["http_client"] is second["http_client"]
+    assert first["http_async_client"] is second["http_async_client"]
+
+
+def test_provider_prefix_in_model_name_gets_pooled_clients(init_kwargs):
+    kwargs = llm._create_llm_use_conf("basic", _conf(model="deepseek:deepseek-chat"))
+
+    assert kwargs["http_client"] is llm._get_http_clients(True)[0]
+
+
+def test_verify_ssl_selects_its_own_client_pair(init_kwargs):
+    kwargs = llm._create_llm_use_conf(
+        "basic", _conf(model_provider="openai", verify_ssl="false")
+    )
+
+    assert "verify_ssl" not in kwargs
+    assert kwargs["http_client"] is llm._get_http_clients(False)[0]
+    assert kwargs["http_client"] is not llm._get_http_clients(True)[0]
+
+
+def test_configured_clients_are_kept(init_kwargs):
+    custom = object()
+    kwargs = llm._create_llm_use_conf(
+        "basic", _conf(model_provider="openai", http_client=custom)
+    )
+
+    assert kwargs["http_client"] is custom
+
+
+def test_other_providers_get_no_http_clients(init_kwargs):
+    kwargs = llm._create_llm_use_conf("basic", _conf(model_provider="anthropic"))
+
+    assert "http_client" not in kwargs
+    assert "http_async_client" not in kwargs
@@ -0,0 +1,102 @@
+import pytest
+from langchain.agents.middleware.summarization import SummarizationMiddleware
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from src.middleware.summarization_middleware import (
+    SUMMARY_ERROR_PREFIX,
+    CachedSummarizationMiddleware,
+    _messages_key,
+)
+
+
+@pytest.fixture
+def summaries(monkeypatch):
+    """Replace the summary LLM call with a counter; returns the call log."""
+    calls = []
+
+    def create_summary(self, messages):
+        calls.append(messages)
+        return f"summary {len(calls)}"
+
+    async def acreate_summary(self, messages):
+        return create_summary(self, messages)
+
+    monkeypatch.setattr(SummarizationMiddleware, "_create_summary", create_summary)
+    monkeypatch.setattr(SummarizationMiddleware, "_acreate_summary", acreate_summary)
+    return calls
+
+
+@pytest.fixture
+def middleware():
+    return CachedSummarizationMiddleware(
+        model=GenericFakeChatModel(messages=iter([])),
+        trigger=("messages", 10),
+    )
+
+
+def _window(tool_call_id="call_1"):
+    return [
+        HumanMessage("search it"),
+        AIMessage("", tool_calls=[{"id": tool_call_id, "name": "web_search", "args": {"q": "x"}}]),
+        ToolMessage("result", tool_call_id=tool_call_id, name="web_search"),
+    ]
+
+
+def test_same_window_reuses_summary(middleware, summaries):
+    first = middleware._create_summary(_window())
+    second = middleware._create_summary(_window())
+
+    assert first == second == "summary 1"
+    assert len(summaries) == 1
+
+
+async def test_same_window_reuses_summary_async(middleware, summaries):
+    first = await middleware._acreate_summary(_window())
+    second = await middleware._acreate_summary(_window())
+
+    assert first == second
+    assert len(summaries) == 1
+
+
+def test_different_window_gets_new_summary(middleware, summaries):
+    middleware._create_summary(_window())
+    middleware._create_summary(_window() + [AIMessage("done")])
+
+    assert len(summaries) == 2
+
+
+def test_key_covers_tool_calls_and_tool_messages():
+    assert _messages_key(_window("call_1")) != _messages_key(_window("call_2"))
+
+    empty_calls = [AIMessage("", tool_calls=[{"id": "a", "name": "ls", "args": {}}])]
+    other_calls = [AIMessage("", tool_calls=[{"id": "a", "name": "glob", "args": {}}])]
+    assert _messages_key(empty_calls) != _messages_key(other_calls)
+
+
+def test_error_summary_is_not_cached(middleware, monkeypatch):
+    calls = []
+
+    def failing_summary(self, messages):
+        calls.append(messages)
+        return f"{SUMMARY_ERROR_PREFIX} rate limited"
+
+    monkeypatch.setattr(SummarizationMiddleware, "_create_summary", failing_summary)
+    middleware._create_summary(_window())
+    middleware._create_summary(_window())
+
+    assert len(calls) == 2
+
+
+def test_cache_is_bounded(summaries):
+    middleware = CachedSummarizationMiddleware(
+        model=GenericFakeChatModel(messages=iter([])),
+        trigger=("messages", 10),
+        cache_size=2,
+    )
+    for text in ("a", "b", "c"):
+        middleware._create_summary([HumanMessage(text)])
+    middleware._create_summary([HumanMessage("a")])
+
+    assert len(middleware._summary_cache) == 2
+    assert len(summaries) == 4
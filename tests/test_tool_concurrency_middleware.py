@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain.messages import AIMessage, ToolMessage
+from langchain.tools.tool_node import ToolCallRequest
+
+from src.middleware.tool_concurrency_middleware import ConcurrentToolExecutorMiddleware
+
+
+def _batch(name, count, message_id="batch"):
+    """Build the requests for `count` parallel calls of one tool from one AIMessage."""
+    tool_calls = [{"id": f"{message_id}_{i}", "name": name, "args": {}} for i in range(count)]
+    state = {"messages": [AIMessage("", id=message_id, tool_calls=tool_calls)]}
+    return [
+        ToolCallRequest(tool_call=tool_call, tool=None, state=state, runtime=None)
+        for tool_call in tool_calls
+    ]
+
+
+class _Tracker:
+    """Async tool handler that records how many calls ran at the same time."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, request):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return ToolMessage("ok", tool_call_id=request.tool_call["id"])
+
+
+class _SyncTracker:
+    """Sync tool handler for the thread-pool path of wrap_tool_call."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.01)
+        with self._lock:
+            self.active -= 1
+        return ToolMessage("ok", tool_call_id=request.tool_call["id"])
+
+
+def _run_sync(middleware, requests, handler):
+    with ThreadPoolExecutor(len(requests)) as pool:
+        return list(pool.map(lambda r: middleware.wrap_tool_call(r, handler), requests))
+
+
+async def _run(middleware, requests, handler):
+    return await asyncio.gather(
+        *(middleware.awrap_tool_call(request, handler) for request in requests)
+    )
+
+
+async def test_safe_tools_run_concurrently():
+    tracker = _Tracker()
+    await _run(ConcurrentToolExecutorMiddleware(), _batch("web_search", 3), tracker)
+
+    assert tracker.peak == 3
+
+
+async def test_unsafe_tools_in_a_batch_run_serially():
+    tracker = _Tracker()
+    await _run(ConcurrentToolExecutorMiddleware(), _batch("python_repl_tool", 3), tracker)
+
+    assert tracker.peak == 1
+
+
+def test_unsafe_tools_in_a_batch_run_serially_sync():
+    tracker = _SyncTracker()
+    middleware = ConcurrentToolExecutorMiddleware()
+    _run_sync(middleware, _batch("python_repl_tool", 3), tracker)
+
+    assert tracker.peak == 1
+    assert not middleware._sync_batches
+
+
+async def test_unsafe_tools_in_different_batches_do_not_block_each_other():
+    tracker = _Tracker()
+    requests = _batch("python_repl_tool", 1, "run_a") + _batch("python_repl_tool", 1, "run_b")
+    await _run(ConcurrentToolExecutorMiddleware(), requests, tracker)
+
+    assert tracker.peak == 2
+
+
+async def test_metadata_overrides_the_default_tool_set():
+    class _Tool:
+        metadata = {"concurrency_safe": True}
+
+    tracker = _Tracker()
+    requests = [request.override(tool=_Tool()) for request in _batch("python_repl_tool", 3)]
+    await _run(ConcurrentToolExecutorMiddleware(), requests, tracker)
+
+    assert tracker.peak == 3
+
+
+async def test_batch_slots_are_released():
+    middleware = ConcurrentToolExecutorMiddleware()
+    await _run(middleware, _batch("python_repl_tool", 2), _Tracker())
+
+    assert not middleware._async_batches[asyncio.get_running_loop()]
+
+
+async def test_subagent_dispatch_honours_the_limit():
+    tracker = _Tracker()
+    middleware = ConcurrentToolExecutorMiddleware(max_concurrent_subagents=2)
+    results = await _run(middleware, _batch("task", 5), tracker)
+
+    assert tracker.peak == 2
+    assert len(results) == 5
+
+
+def test_subagent_dispatch_honours_the_limit_sync():
+    tracker = _SyncTracker()
+    middleware = ConcurrentToolExecutorMiddleware(max_concurrent_subagents=2)
+    _run_sync(middleware, _batch("task", 5), tracker)
+
+    assert tracker.peak == 2
+
+
+async def test_subagent_limit_applies_per_batch():
+    tracker = _Tracker()
+    middleware = ConcurrentToolExecutorMiddleware(max_concurrent_subagents=1)
+    requests = _batch("task", 2, "run_a") + _batch("task", 2, "run_b")
+    await _run(middleware, requests, tracker)
+
+    assert tracker.peak == 2
+
+
+async def test_subagents_are_unbounded_without_a_limit():
+    tracker = _Tracker()
+    await _run(ConcurrentToolExecutorMiddleware(), _batch("task", 4), tracker)
+
+    assert tracker.peak == 4